@@ -1,7 +1,8 @@
-from typing import Optional, Union, List
-from fastapi import APIRouter, HTTPException, UploadFile, File
-from pydantic import BaseModel, Field
-from app.utils import (_get_client, _safe_json_parse, _strip_data_url, DocumentAnalysis, extract_text_from_pdf_bytes)
+from typing import Optional, Union, List, Set, Tuple
+from fastapi import APIRouter, HTTPException, UploadFile, File, Query
+from pydantic import BaseModel, Field, model_validator
+from app.document_store import document_store
+from app.utils import (_get_client, _safe_json_parse, _strip_data_url, DocumentAnalysis, PdfPage, extract_text_from_pdf_bytes, iter_pdf_pages, join_pdf_pages)
 import base64
 
 
@@ -9,17 +10,126 @@ router = APIRouter(prefix="/analyze_doc", tags=["Analyze"])
 
 
 class AnalyzeRequest(BaseModel):
-    file_content: str = Field(..., min_length=1)
+    file_content: Optional[str] = Field(default=None, min_length=1)
+    document_id: Optional[str] = None
     is_image: bool = False
     mime_type: str = "text/plain"
     is_base64: bool = False
 
+    @model_validator(mode="after")
+    def _require_content(self) -> "AnalyzeRequest":
+        if not self.file_content and not self.document_id:
+            raise ValueError("Provide either file_content or document_id")
+        return self
+
 
 class AnalyzeResponse(BaseModel):
-    purpose: str
-    summary: str
-    transcribed_text: str
-    requirements: List[str]
+    # Fields left as None were not requested via `fields=` and are dropped from the payload.
+    purpose: Optional[str] = None
+    summary: Optional[str] = None
+    transcribed_text: Optional[str] = None
+    requirements: Optional[List[str]] = None
+    # Set for PDFs, where transcribed_text is the extracted page text rather than the model's.
+    transcript_page_count: Optional[int] = None
+    transcript_pages_available: Optional[int] = None
+
+
+RESPONSE_FIELDS = ("purpose", "summary", "transcribed_text", "requirements")
+
+PageRange = Tuple[int, Optional[int]]
+
+
+def _parse_fields(fields: Optional[str]) -> Set[str]:
+    if fields is None:
+        return set(RESPONSE_FIELDS)
+    selected = {name.strip() for name in fields.split(",") if name.strip()}
+    if not selected:
+        raise ValueError("fields must name at least one of: " + ", ".join(RESPONSE_FIELDS))
+    unknown = selected - set(RESPONSE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return selected
+
+
+def _parse_page_selection(spec: str) -> List[PageRange]:
+    """Parse a 1-based selection such as ``"1-3,5,8-"``; an open end means "to the last page"."""
+    ranges: List[PageRange] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, dash, last = part.partition("-")
+        try:
+            start = int(first)
+            end = int(last) if last else (None if dash else start)
+        except ValueError as exc:
+            raise ValueError(f"Invalid transcript_pages value: {part!r}") from exc
+        if start < 1 or (end is not None and end < start):
+            raise ValueError(f"Invalid transcript_pages range: {part!r}")
+        ranges.append((start, end))
+    if not ranges:
+        raise ValueError("transcript_pages must select at least one page")
+    return ranges
+
+
+def _select_pages(pages: Optional[List[PdfPage]], ranges: List[PageRange]) -> List[PdfPage]:
+    if pages is None:
+        raise ValueError("transcript_pages is only supported for PDF documents")
+    by_number = {page.number: page for page in pages}
+    page_count = len(pages)
+    numbers: Set[int] = set()
+    for start, end in ranges:
+        end = page_count if end is None else end
+        if end > page_count or start > page_count:
+            raise ValueError(f"transcript_pages out of range: {page_count} page(s) available")
+        numbers.update(range(start, end + 1))
+    return [by_number[number] for number in sorted(numbers)]
+
+
+def _parse_query(fields: Optional[str], transcript_pages: Optional[str]) -> Tuple[Set[str], Optional[List[PageRange]]]:
+    # Validated before any Gemini call so a bad query string never costs a model round-trip.
+    try:
+        selected = _parse_fields(fields)
+        ranges = _parse_page_selection(transcript_pages) if transcript_pages is not None else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return selected, ranges
+
+
+def _load_pdf_pages(content: Union[str, bytes], mime_type: str) -> Optional[List[PdfPage]]:
+    if isinstance(content, (bytes, bytearray)) and (mime_type == "application/pdf" or content[:4] == b"%PDF"):
+        return list(iter_pdf_pages(bytes(content)))
+    return None
+
+
+def _transcript_for(pages: Optional[List[PdfPage]], ranges: Optional[List[PageRange]]) -> Optional[str]:
+    """Extracted PDF text for the selected pages (all pages without a selection).
+
+    Returns None for non-PDF input, whose transcript comes from the model.
+    """
+    if ranges is None:
+        return join_pdf_pages(pages) if pages is not None else None
+    try:
+        return join_pdf_pages(_select_pages(pages, ranges))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+def build_analyze_response(
+    result: DocumentAnalysis,
+    fields: Optional[Set[str]] = None,
+    transcript: Optional[str] = None,
+    page_count: Optional[int] = None,
+    pages_available: Optional[int] = None,
+) -> AnalyzeResponse:
+    """Shape the response; ``transcript`` replaces the model's text for PDF input."""
+    selected = set(RESPONSE_FIELDS) if fields is None else fields
+    response = AnalyzeResponse(**{name: getattr(result, name) for name in selected})
+    if transcript is not None and "transcribed_text" in selected:
+        response.transcribed_text = transcript
+        response.transcript_page_count = page_count
+        response.transcript_pages_available = pages_available
+    return response
 
 def analyze_document(
     file_content: Union[str, bytes],
@@ -114,68 +224,134 @@ def analyze_document(
     return result
 
 
-@router.post("", response_model=AnalyzeResponse)
-def analyze_document_endpoint(payload: AnalyzeRequest) -> AnalyzeResponse:
-    try:
-        content: Union[str, bytes] = payload.file_content
-        if payload.is_base64 and not payload.is_image:
-            content = base64.b64decode(payload.file_content)
+FIELDS_QUERY = Query(
+    default=None,
+    description="Comma-separated response fields to return, e.g. 'purpose,summary,requirements'.",
+)
+TRANSCRIPT_PAGES_QUERY = Query(
+    default=None,
+    description="1-based transcript pages to return, e.g. '1-3,5'.",
+)
+
 
+@router.post("", response_model=AnalyzeResponse, response_model_exclude_none=True)
+def analyze_document_endpoint(
+    payload: AnalyzeRequest,
+    fields: Optional[str] = FIELDS_QUERY,
+    transcript_pages: Optional[str] = TRANSCRIPT_PAGES_QUERY,
+) -> AnalyzeResponse:
+    selected_fields, page_ranges = _parse_query(fields, transcript_pages)
+
+    is_image = payload.is_image
+    pages: Optional[List[PdfPage]] = None
+    page_count: Optional[int] = None
+    if payload.file_content is None:
+        # Analyze whatever /ingestpdf has indexed for this document so far.
+        try:
+            pages = document_store.get_pages(payload.document_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail="Document not found") from exc
+        except ValueError as exc:
+            raise HTTPException(status_code=409, detail=str(exc)) from exc
+        stored = document_store.get(payload.document_id)
+        # The document may still be ingesting: report its real total, not just the pages seen so far.
+        page_count = stored.page_count if stored is not None and stored.page_count else len(pages)
+        content: Union[str, bytes] = join_pdf_pages(pages)
+        is_image = False
+    else:
+        try:
+            content = payload.file_content
+            if payload.is_base64 and not payload.is_image:
+                content = base64.b64decode(payload.file_content)
+                pages = _load_pdf_pages(content, payload.mime_type)
+                if pages is not None:
+                    content = join_pdf_pages(pages)
+                    page_count = len(pages)
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    transcript = _transcript_for(pages, page_ranges)
+
+    try:
         result = analyze_document(
             file_content=content,
-            is_image=payload.is_image,
+            is_image=is_image,
             mime_type=payload.mime_type,
             model="gemini-2.5-flash-lite",
         )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-    return AnalyzeResponse(
-        purpose=result.purpose,
-        summary=result.summary,
-        transcribed_text=result.transcribed_text,
-        requirements=result.requirements,
+    return build_analyze_response(
+        result,
+        fields=selected_fields,
+        transcript=transcript,
+        page_count=page_count,
+        pages_available=len(pages) if pages is not None else None,
     )
 
 
-@router.post("/upload", response_model=AnalyzeResponse)
+@router.post("/upload", response_model=AnalyzeResponse, response_model_exclude_none=True)
 async def analyze_document_upload(
     file: UploadFile = File(...),
     model: Optional[str] = "gemini-2.5-flash-lite",
+    fields: Optional[str] = FIELDS_QUERY,
+    transcript_pages: Optional[str] = TRANSCRIPT_PAGES_QUERY,
 ) -> AnalyzeResponse:
     if not file.content_type:
         raise HTTPException(status_code=400, detail="Missing content type")
 
+    selected_fields, page_ranges = _parse_query(fields, transcript_pages)
+    is_image = file.content_type.startswith("image/")
+
     pdf_bytes = await file.read()
 
+    content: Union[str, bytes] = pdf_bytes
+    pages: Optional[List[PdfPage]] = None
+    try:
+        if not is_image:
+            # Extract once up front so the per-page text can back transcript_pages.
+            pages = _load_pdf_pages(pdf_bytes, file.content_type)
+            if pages is not None:
+                content = join_pdf_pages(pages)
+    except Exception as exc:
+        raise _upload_error(exc) from exc
+
+    transcript = _transcript_for(pages, page_ranges)
+
     try:
         result = analyze_document(
-            file_content=pdf_bytes,
-            is_image=file.content_type.startswith("image/"),
+            file_content=content,
+            is_image=is_image,
             mime_type=file.content_type,
             model=model,
         )
     except Exception as exc:
-        print(f"Exception in analyze_document_upload: {exc}")
-        # Custom error handling for Gemini API errors
-        error_message = str(exc)
-        if "Missing GEMINI_API_KEY" in error_message:
-            user_message = "Server configuration error: Gemini API key is missing. Please contact support."
-            status_code = 500
-        elif "model is overloaded" in error_message or "UNAVAILABLE" in error_message:
-            user_message = "Document analysis service is temporarily unavailable due to high demand. Please try again later."
-            status_code = 503
-        elif "Empty response from Gemini" in error_message:
-            user_message = "Document analysis service returned no result. Please try again or contact support."
-            status_code = 502
-        else:
-            user_message = f"An unexpected error occurred: {error_message}"
-            status_code = 500
-        raise HTTPException(status_code=status_code, detail=user_message) from exc
-
-    return AnalyzeResponse(
-        purpose=result.purpose,
-        summary=result.summary,
-        transcribed_text=result.transcribed_text,
-        requirements=result.requirements,
-    )
\ No newline at end of file
+        raise _upload_error(exc) from exc
+
+    return build_analyze_response(
+        result,
+        fields=selected_fields,
+        transcript=transcript,
+        page_count=len(pages) if pages is not None else None,
+        pages_available=len(pages) if pages is not None else None,
+    )
+
+
+def _upload_error(exc: Exception) -> HTTPException:
+    print(f"Exception in analyze_document_upload: {exc}")
+    # Custom error handling for Gemini API errors
+    error_message = str(exc)
+    if "Missing GEMINI_API_KEY" in error_message:
+        user_message = "Server configuration error: Gemini API key is missing. Please contact support."
+        status_code = 500
+    elif "model is overloaded" in error_message or "UNAVAILABLE" in error_message:
+        user_message = "Document analysis service is temporarily unavailable due to high demand. Please try again later."
+        status_code = 503
+    elif "Empty response from Gemini" in error_message:
+        user_message = "Document analysis service returned no result. Please try again or contact support."
+        status_code = 502
+    else:
+        user_message = f"An unexpected error occurred: {error_message}"
+        status_code = 500
+    return HTTPException(status_code=status_code, detail=user_message)
@@ -1,6 +1,9 @@
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from app.document_store import document_store
 from app.utils import _get_client, _safe_json_parse
 
 
@@ -9,7 +12,14 @@ router = APIRouter(prefix="/chat", tags=["Chat"])
 
 class ChatRequest(BaseModel):
     question: str = Field(..., min_length=1)
-    document_context: str = Field(..., min_length=1)
+    document_context: Optional[str] = Field(default=None, min_length=1)
+    document_id: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _require_context(self) -> "ChatRequest":
+        if not self.document_context and not self.document_id:
+            raise ValueError("Provide either document_context or document_id")
+        return self
 
 
 class ChatResponse(BaseModel):
@@ -27,6 +37,16 @@ def chat_endpoint(payload: ChatRequest) -> ChatResponse:
         "{\n  \"answer\": string\n}"
     )
 
+    document_context = payload.document_context
+    if document_context is None:
+        # Uses the pages indexed so far, even if /ingestpdf is still streaming.
+        try:
+            document_context = document_store.get_text(payload.document_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail="Document not found") from exc
+        except ValueError as exc:
+            raise HTTPException(status_code=409, detail=str(exc)) from exc
+
     client = _get_client()
     selected_model = "gemini-2.5-flash-lite"
 
@@ -34,7 +54,7 @@ def chat_endpoint(payload: ChatRequest) -> ChatResponse:
         response = client.models.generate_content(
             model=selected_model,
             contents=(
-                f"{prompt}\n\nDOCUMENT CONTEXT:\n{payload.document_context}"
+                f"{prompt}\n\nDOCUMENT CONTEXT:\n{document_context}"
                 f"\n\nUSER QUESTION:\n{payload.question}"
             ),
             config={"response_mime_type": "application/json"},
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Request
+from starlette.responses import JSONResponse
+
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get("/health")
+def health_endpoint() -> dict:
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+def ready_endpoint(request: Request) -> JSONResponse:
+    state = getattr(request.app.state, "warmup", None)
+    if state is None:
+        return JSONResponse(status_code=503, content={"ready": False})
+    return JSONResponse(status_code=200 if state.ready else 503, content=state.to_dict())
@@ -1,30 +1,102 @@
+import json
+from typing import Iterator, List, Optional
+
 from fastapi import UploadFile, File
 from fastapi import APIRouter, HTTPException
-import tempfile
-import os
+from pydantic import BaseModel
+from starlette.responses import StreamingResponse
+
+from app.document_store import DocumentStoreFull, document_store
+from app.utils import iter_pdf_pages
 
 router = APIRouter(prefix="/ingestpdf", tags=["PDF Ingestion"])
 
-@router.post("/ingestpdf")
-async def upload_pdf(file: UploadFile = File(...)):
+
+class IngestedPage(BaseModel):
+    page: int
+    chars: int
+    words: int
+
+
+class IngestStatusResponse(BaseModel):
+    document_id: str
+    filename: str
+    status: str
+    page_count: Optional[int]
+    pages_indexed: int
+    pages: List[IngestedPage]
+    error: Optional[str] = None
+
+
+def _ndjson(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _ingest_pages(document_id: str, filename: str, pdf_bytes: bytes) -> Iterator[str]:
+    yield _ndjson({"type": "document", "document_id": document_id, "filename": filename})
+
+    indexed = 0
+    # Stays set unless the loop runs to completion or fails with a real error, so a
+    # client disconnect (GeneratorExit at a yield) still marks the document failed.
+    error: Optional[str] = "client disconnected"
+    try:
+        # Each page is indexed before it is sent, so /chat and /analyze_doc can
+        # already use it by the time the client sees it.
+        for page in iter_pdf_pages(pdf_bytes):
+            document_store.add_page(document_id, page)
+            indexed += 1
+            yield _ndjson({"type": "page", **page.to_dict()})
+        error = None
+    except Exception as exc:
+        print(f"Exception in ingest for {document_id}: {exc}")
+        error = str(exc)
+    finally:
+        document_store.finish(document_id, error=error)
+
+    if error is not None:
+        yield _ndjson({"type": "error", "document_id": document_id, "detail": error})
+        return
+    yield _ndjson({"type": "done", "document_id": document_id, "pages": indexed})
+
+
+@router.post("")
+async def upload_pdf(file: UploadFile = File(...)) -> StreamingResponse:
     if file.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="Only PDFs allowed")
 
-    # Save uploaded PDF to a temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(await file.read())
-        pdf_path = tmp.name
+    pdf_bytes = await file.read()
+    if not pdf_bytes:
+        raise HTTPException(status_code=400, detail="Empty file")
 
+    filename = file.filename or "document.pdf"
     try:
-        # 🔥 Treat this exactly like a normal Python file now
-        print("PDF saved at:", pdf_path)
+        document = document_store.create(filename)
+    except DocumentStoreFull as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-        # process_pdf(pdf_path)
+    return StreamingResponse(
+        _ingest_pages(document.document_id, filename, pdf_bytes),
+        media_type="application/x-ndjson",
+        headers={"X-Document-Id": document.document_id},
+    )
 
-        return {
-            "filename": file.filename,
-            "status": "received"
-        }
 
-    finally:
-        os.remove(pdf_path)
+@router.get("/{document_id}", response_model=IngestStatusResponse)
+def ingest_status(document_id: str) -> IngestStatusResponse:
+    document = document_store.get(document_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    pages = list(document.pages)
+    return IngestStatusResponse(
+        document_id=document.document_id,
+        filename=document.filename,
+        status=document.status,
+        page_count=document.page_count,
+        pages_indexed=len(pages),
+        pages=[
+            IngestedPage(page=page.number, chars=page.chars, words=page.words)
+            for page in pages
+        ],
+        error=document.error,
+    )
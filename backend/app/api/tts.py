@@ -1,13 +1,11 @@
 import os
 
 import anyio
-from elevenlabs.client import ElevenLabs
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 from starlette.responses import Response
-from dotenv import load_dotenv
 
-load_dotenv()
+from app.utils import _get_tts_client
 
 router = APIRouter(prefix="/tts", tags=["TTS"])
 
@@ -20,14 +18,13 @@ class TTSRequest(BaseModel):
 
 @router.post("", response_class=Response)
 async def synthesize_tts(payload: TTSRequest) -> Response:
-	api_key = os.getenv("ELEVENLABS_API_KEY")
-	if not api_key:
-		raise HTTPException(status_code=500, detail="Missing ELEVENLABS_API_KEY")
+	try:
+		client = _get_tts_client()
+	except ValueError as exc:
+		raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 	voice_id = os.getenv("ELEVENLABS_VOICE_ID", "hpp4J3VqNfWAUOO0d1Us")
 
-	client = ElevenLabs(api_key=api_key)
-
 	try:
 		audio = await anyio.to_thread.run_sync(
 			lambda: client.text_to_speech.convert(
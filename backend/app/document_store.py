@@ -0,0 +1,98 @@
+from __future__ import annotations
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from app.utils import PdfPage, join_pdf_pages
+
+
+@dataclass
+class StoredDocument:
+    document_id: str
+    filename: str
+    page_count: Optional[int] = None
+    pages: List[PdfPage] = field(default_factory=list)
+    status: str = "ingesting"
+    error: Optional[str] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.status == "complete"
+
+
+class DocumentStoreFull(RuntimeError):
+    pass
+
+
+class DocumentStore:
+    """In-process store of ingested documents, filled page by page.
+
+    Readers get whatever pages have been indexed so far, so downstream
+    endpoints can work on a document while it is still being parsed.
+    The store lives in one worker process, so a document_id only resolves
+    on the worker that ingested it.
+    """
+
+    def __init__(self, max_documents: int = 100) -> None:
+        self._documents: Dict[str, StoredDocument] = {}
+        self._lock = threading.Lock()
+        self._max_documents = max_documents
+
+    def create(self, filename: str) -> StoredDocument:
+        document = StoredDocument(document_id=uuid.uuid4().hex, filename=filename)
+        with self._lock:
+            if len(self._documents) >= self._max_documents:
+                # Dicts keep insertion order, so this finds the oldest finished document.
+                # Documents still ingesting are never evicted mid-stream.
+                evictable = next(
+                    (key for key, stored in self._documents.items() if stored.status != "ingesting"),
+                    None,
+                )
+                if evictable is None:
+                    raise DocumentStoreFull("Too many documents are being ingested; try again later")
+                self._documents.pop(evictable)
+            self._documents[document.document_id] = document
+        return document
+
+    def add_page(self, document_id: str, page: PdfPage) -> None:
+        with self._lock:
+            document = self._documents.get(document_id)
+            if document is None:
+                return
+            document.page_count = page.page_count
+            document.pages.append(page)
+
+    def finish(self, document_id: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            document = self._documents.get(document_id)
+            if document is None:
+                return
+            document.status = "failed" if error else "complete"
+            document.error = error
+
+    def get(self, document_id: str) -> Optional[StoredDocument]:
+        with self._lock:
+            return self._documents.get(document_id)
+
+    def get_pages(self, document_id: str) -> List[PdfPage]:
+        """Snapshot of the pages indexed so far; raises if ingestion failed or no page has text."""
+        document = self.get(document_id)
+        if document is None:
+            raise KeyError(f"Unknown document_id: {document_id}")
+        with self._lock:
+            pages = list(document.pages)
+            status, error = document.status, document.error
+        if status == "failed":
+            # A failed or abandoned ingest only holds a partial document.
+            raise ValueError(f"Document ingestion failed: {error}")
+        # Page markers alone are not content; scanned or still-empty documents have nothing to send.
+        if not any(page.text.strip() for page in pages):
+            raise ValueError("Document has no extracted text yet")
+        return pages
+
+    def get_text(self, document_id: str) -> str:
+        return join_pdf_pages(self.get_pages(document_id))
+
+
+document_store = DocumentStore()
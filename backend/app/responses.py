@@ -0,0 +1,119 @@
+from __future__ import annotations
+from typing import Dict
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import brotli
+except Exception:  # pragma: no cover - optional speedup
+    brotli = None
+
+
+# Bodies that are already compressed (e.g. /tts MP3 audio) gain nothing from another pass.
+PRECOMPRESSED_CONTENT_TYPES = (
+    "audio/",
+    "image/",
+    "video/",
+    "application/zip",
+    "application/gzip",
+)
+
+# orjson renders the encoded response body faster than the stdlib encoder.
+FastJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+def _parse_accept_encoding(value: str) -> Dict[str, float]:
+    encodings: Dict[str, float] = {}
+    for item in value.split(","):
+        name, *params = [part.strip() for part in item.split(";")]
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            if param.lower().startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        encodings[name.lower()] = quality
+    return encodings
+
+
+class _SkipPrecompressedMixin:
+    async def send_with_compression(self, message: Message) -> None:
+        await super().send_with_compression(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith(PRECOMPRESSED_CONTENT_TYPES):
+                # Reuses the passthrough path starlette takes for text/event-stream.
+                self.content_type_is_excluded = True
+
+
+class StreamingGZipResponder(_SkipPrecompressedMixin, GZipResponder):
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if more_body:
+            # Sync-flush each chunk so NDJSON lines reach the client as they are produced.
+            self.gzip_file.write(body)
+            self.gzip_file.flush()
+            body = self.gzip_buffer.getvalue()
+            self.gzip_buffer.seek(0)
+            self.gzip_buffer.truncate()
+            return body
+        return super().apply_compression(body, more_body=more_body)
+
+
+class BrotliResponder(_SkipPrecompressedMixin, IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 5) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        compressed = self.compressor.process(body)
+        if more_body:
+            return compressed + self.compressor.flush()
+        return compressed + self.compressor.finish()
+
+
+class CompressionMiddleware:
+    """Compress responses with brotli or gzip, whichever the client prefers.
+
+    Brotli is only offered when the ``brotli`` package is installed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = _parse_accept_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+        responder: ASGIApp
+        if brotli is not None and accepted.get("br", 0) > 0 and accepted["br"] >= accepted.get("gzip", 0):
+            responder = BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality)
+        elif accepted.get("gzip", 0) > 0:
+            responder = StreamingGZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+
+        await responder(scope, receive, send)
@@ -1,25 +1,21 @@
 from __future__ import annotations
-from dotenv import load_dotenv
+from functools import lru_cache
 import json
 import os
 import re
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Iterable
-try:
-    from pypdf import PdfReader
-except Exception:  # pragma: no cover - runtime guard
-    PdfReader = None
+from typing import Iterable, Iterator
 
 if TYPE_CHECKING:
+    from elevenlabs.client import ElevenLabs
     from google import genai
 
 
-
-load_dotenv()
-
-def _get_client() -> "genai.Client":
+@lru_cache(maxsize=None)
+def _build_client(api_key: str) -> "genai.Client":
+    # Heavy provider SDK is imported on first use so app import stays fast.
     try:
         from google import genai as genai_module
     except Exception:
@@ -30,11 +26,27 @@ def _get_client() -> "genai.Client":
                 "google-genai is not available in the active interpreter. "
                 "Install it in the same environment running the app."
             ) from exc
+    return genai_module.Client(api_key=api_key)
 
+def _get_client() -> "genai.Client":
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
         raise ValueError("Missing GEMINI_API_KEY environment variable.")
-    return genai_module.Client(api_key=api_key)
+    # Reuse one client (and its connection pool) per API key.
+    return _build_client(api_key)
+
+@lru_cache(maxsize=None)
+def _build_tts_client(api_key: str) -> "ElevenLabs":
+    # elevenlabs is only imported once a client is actually needed.
+    from elevenlabs.client import ElevenLabs
+
+    return ElevenLabs(api_key=api_key)
+
+def _get_tts_client() -> "ElevenLabs":
+    api_key = os.getenv("ELEVENLABS_API_KEY")
+    if not api_key:
+        raise ValueError("Missing ELEVENLABS_API_KEY")
+    return _build_tts_client(api_key)
 
 def _safe_json_parse(text: str) -> Dict[str, Any]:
     try:
@@ -79,20 +91,69 @@ class SimplifyResult:
             key_terms=list(data.get("keyTerms", data.get("key_terms", []))),
         )
 
-def extract_text_from_pdf_bytes(data: bytes) -> str:
-    if PdfReader is None:
+def _get_pdf_reader_class():
+    try:
+        from pypdf import PdfReader
+    except Exception as exc:  # pragma: no cover - runtime guard
         raise ImportError(
             "pypdf is not available in the active interpreter. "
             "Install it in the same environment running the app."
-        )
+        ) from exc
+    return PdfReader
+
+@dataclass
+class PdfPage:
+    number: int
+    page_count: int
+    text: str
+    width: float
+    height: float
+
+    @property
+    def chars(self) -> int:
+        return len(self.text)
+
+    @property
+    def words(self) -> int:
+        return len(self.text.split())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "page": self.number,
+            "text": self.text,
+            "metadata": {
+                "page_count": self.page_count,
+                "chars": self.chars,
+                "words": self.words,
+                "width": self.width,
+                "height": self.height,
+            },
+        }
+
+def iter_pdf_pages(data: bytes) -> Iterator[PdfPage]:
+    """Yield pages one at a time so callers can act before the whole PDF is parsed."""
+    PdfReader = _get_pdf_reader_class()
     reader = PdfReader(BytesIO(data))
-    full_text_parts: list[str] = []
+    page_count = len(reader.pages)
 
     for index, page in enumerate(reader.pages, start=1):
-        page_text = page.extract_text() or ""
-        full_text_parts.append(f"--- Page {index} ---\n{page_text}\n")
+        box = page.mediabox
+        yield PdfPage(
+            number=index,
+            page_count=page_count,
+            text=page.extract_text() or "",
+            width=float(box.width),
+            height=float(box.height),
+        )
+
+def format_page_text(number: int, text: str) -> str:
+    return f"--- Page {number} ---\n{text}\n"
 
-    return "\n".join(full_text_parts).strip()
+def join_pdf_pages(pages: Iterable[PdfPage]) -> str:
+    return "\n".join(format_page_text(page.number, page.text) for page in pages).strip()
+
+def extract_text_from_pdf_bytes(data: bytes) -> str:
+    return join_pdf_pages(iter_pdf_pages(data))
 
 
 def extract_text_from_pdf_stream(stream: BytesIO) -> str:
@@ -0,0 +1,149 @@
+from __future__ import annotations
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Callable, Dict, FrozenSet, Optional
+
+import anyio
+
+from app.utils import _get_client, _get_tts_client, extract_text_from_pdf_bytes
+
+WARMUP_MODEL = "gemini-2.5-flash-lite"
+DEFAULT_REQUIRED_STEPS = "pdf_extractor,gemini"
+RETRY_INITIAL_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+
+def _prime_pdf_extractor() -> None:
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    buffer = BytesIO()
+    writer.write(buffer)
+    extract_text_from_pdf_bytes(buffer.getvalue())
+
+
+def _warm_gemini() -> None:
+    client = _get_client()
+    if _connect_enabled():
+        # A metadata lookup opens the pooled HTTPS connection without generating content.
+        client.models.get(model=WARMUP_MODEL)
+
+
+def _warm_tts() -> None:
+    client = _get_tts_client()
+    if _connect_enabled():
+        client.models.list()
+
+
+def _connect_enabled() -> bool:
+    return os.getenv("WARMUP_CONNECT", "1").lower() not in ("0", "false", "no")
+
+
+def _step_timeout() -> float:
+    return float(os.getenv("WARMUP_STEP_TIMEOUT", "10"))
+
+
+WARMUP_STEPS: Dict[str, Callable[[], None]] = {
+    "pdf_extractor": _prime_pdf_extractor,
+    "gemini": _warm_gemini,
+    "tts": _warm_tts,
+}
+
+
+def _required_steps() -> FrozenSet[str]:
+    # WARMUP_REQUIRED lists the steps that must succeed before /ready reports 200.
+    value = os.getenv("WARMUP_REQUIRED", DEFAULT_REQUIRED_STEPS)
+    names = frozenset(name.strip() for name in value.split(",") if name.strip())
+    unknown = names - set(WARMUP_STEPS)
+    if unknown:
+        # An unknown name could never succeed and would keep the worker unready forever.
+        print(f"Ignoring unknown WARMUP_REQUIRED steps: {', '.join(sorted(unknown))}")
+    return names & frozenset(WARMUP_STEPS)
+
+
+@dataclass
+class WarmupState:
+    finished: bool = False
+    ready: bool = False
+    required: FrozenSet[str] = field(default_factory=_required_steps)
+    steps: Dict[str, str] = field(default_factory=dict)
+    attempts: Dict[str, int] = field(default_factory=dict)
+    duration_ms: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "ready": self.ready,
+            "finished": self.finished,
+            "required": sorted(self.required),
+            "steps": dict(self.steps),
+            "attempts": dict(self.attempts),
+            "duration_ms": self.duration_ms,
+        }
+
+    def pending_required(self) -> FrozenSet[str]:
+        return frozenset(name for name in self.required if self.steps.get(name) != "ok")
+
+
+def _call_with_timeout(step: Callable[[], None], timeout: float) -> None:
+    # A daemon thread lets a hung provider call be given up on without blocking warm-up.
+    outcome: Dict[str, BaseException] = {}
+
+    def target() -> None:
+        try:
+            step()
+        except BaseException as exc:
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"timed out after {timeout:g}s")
+    if "error" in outcome:
+        raise outcome["error"]
+
+
+def _run_step(state: WarmupState, name: str) -> None:
+    state.attempts[name] = state.attempts.get(name, 0) + 1
+    try:
+        _call_with_timeout(WARMUP_STEPS[name], _step_timeout())
+        state.steps[name] = "ok"
+    except Exception as exc:
+        print(f"Warm-up step '{name}' failed (attempt {state.attempts[name]}): {exc}")
+        state.steps[name] = f"failed: {exc}"
+
+
+def warm_up(state: WarmupState) -> WarmupState:
+    """Run every warm-up step once, recording failures instead of raising.
+
+    The worker is only marked ready when every required step succeeded;
+    optional steps that fail fall back to lazy setup on first use.
+    """
+    started = time.perf_counter()
+    for name in WARMUP_STEPS:
+        _run_step(state, name)
+    state.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+    state.ready = not state.pending_required()
+    state.finished = True
+    return state
+
+
+def retry_required(state: WarmupState) -> WarmupState:
+    for name in sorted(state.pending_required()):
+        _run_step(state, name)
+    state.ready = not state.pending_required()
+    return state
+
+
+async def run_warm_up(state: WarmupState) -> None:
+    """Warm up, then keep retrying failed required steps with backoff until ready."""
+    await anyio.to_thread.run_sync(warm_up, state, abandon_on_cancel=True)
+    delay = RETRY_INITIAL_DELAY
+    while not state.ready:
+        await anyio.sleep(delay)
+        delay = min(delay * 2, RETRY_MAX_DELAY)
+        await anyio.to_thread.run_sync(retry_required, state, abandon_on_cancel=True)
@@ -0,0 +1,137 @@
+"""Payload size and serialization benchmark for /analyze_doc responses.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks.payload --pages 40 --runs 200
+    python -m benchmarks.payload --pdf path/to/form.pdf
+
+Builds an analysis of a multi-page document (randomized legal-style text, or a
+real PDF with ``--pdf``) and reports the encoded size of the full,
+transcript-paged and transcript-free responses under each compression. It then
+times FastAPI's full response path (response model validation, serialization
+and body rendering) with the stdlib and orjson JSON responses.
+"""
+import argparse
+import gzip
+import random
+import statistics
+import time
+from typing import List
+
+import anyio
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from app.api import analyze_doc
+from app.api.analyze_doc import AnalyzeResponse, build_analyze_response
+from app.responses import FastJSONResponse, brotli
+from app.utils import DocumentAnalysis, PdfPage, iter_pdf_pages, join_pdf_pages
+
+_WORDS = (
+    "applicant agency amendment appeal benefit claimant clerk county court date deadline "
+    "department determination document eligibility employer enrollment evidence exemption "
+    "fee filing form guardian hearing household income insurance judgment landlord license "
+    "notice obligation office payment penalty permit petition proof record renewal request "
+    "residency resident review section signature statement submit tenant verification "
+    "within must shall may not the a of to and or for by under pursuant following any each"
+).split()
+
+
+def _random_sentence(rng: random.Random) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(8, 22))]
+    if rng.random() < 0.4:
+        words.insert(rng.randrange(len(words)), f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/{rng.randint(2024, 2027)}")
+    if rng.random() < 0.3:
+        words.insert(rng.randrange(len(words)), f"${rng.randint(10, 5000)}.{rng.randint(0, 99):02d}")
+    return " ".join(words).capitalize() + "."
+
+
+def _build_pages(count: int, seed: int = 0) -> List[PdfPage]:
+    rng = random.Random(seed)
+    return [
+        PdfPage(
+            number=number,
+            page_count=count,
+            text=" ".join(_random_sentence(rng) for _ in range(30)),
+            width=612.0,
+            height=792.0,
+        )
+        for number in range(1, count + 1)
+    ]
+
+
+def _build_analysis(pages: List[PdfPage]) -> DocumentAnalysis:
+    return DocumentAnalysis(
+        purpose="Apply for a residential parking permit.",
+        summary="You need to fill out this form and bring it to the clerk with your ID and fee.",
+        transcribed_text=join_pdf_pages(pages),
+        requirements=["Bring photo ID", "Bring proof of residency", "Pay the filing fee"],
+    )
+
+
+async def _encode(route, response_class, response: AnalyzeResponse) -> bytes:
+    # Same steps FastAPI runs after the endpoint returns: validate and serialize
+    # against the route's response model, then render the body.
+    content = await serialize_response(
+        field=route.response_field,
+        response_content=response,
+        exclude_none=route.response_model_exclude_none,
+        is_coroutine=True,
+    )
+    return response_class(content).body
+
+
+async def _time_response_path(route, response_class, response: AnalyzeResponse, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await _encode(route, response_class, response)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    if args.pdf:
+        with open(args.pdf, "rb") as handle:
+            pages = list(iter_pdf_pages(handle.read()))
+    else:
+        pages = _build_pages(args.pages)
+    analysis = _build_analysis(pages)
+    route = next(route for route in analyze_doc.router.routes if route.path == "/analyze_doc")
+
+    variants = {
+        "full": build_analyze_response(
+            analysis, transcript=join_pdf_pages(pages), page_count=len(pages), pages_available=len(pages)
+        ),
+        "transcript_pages=1": build_analyze_response(
+            analysis, transcript=join_pdf_pages(pages[:1]), page_count=len(pages), pages_available=len(pages)
+        ),
+        "fields=purpose,summary,requirements": build_analyze_response(
+            analysis, fields={"purpose", "summary", "requirements"}
+        ),
+    }
+
+    print(f"{'variant':<40}{'raw':>10}{'gzip':>10}{'br':>10}")
+    for name, response in variants.items():
+        body = await _encode(route, FastJSONResponse, response)
+        gzip_size = len(gzip.compress(body, compresslevel=6))
+        br_size = len(brotli.compress(body, quality=5)) if brotli is not None else "n/a"
+        print(f"{name:<40}{len(body):>10}{gzip_size:>10}{br_size:>10}")
+
+    print(f"\nfull response path, validate + serialize + render (median of {args.runs}):")
+    for response_class in (JSONResponse, FastJSONResponse):
+        elapsed = await _time_response_path(route, response_class, variants["full"], args.runs)
+        print(f"  {response_class.__name__}: {elapsed:.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--pdf", help="Use the text of a real PDF instead of generated pages.")
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    anyio.run(_run, args)
+
+
+if __name__ == "__main__":
+    main()
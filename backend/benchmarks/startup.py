@@ -0,0 +1,64 @@
+"""Cold-start benchmark for the backend.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks.startup --runs 10
+
+Each run imports ``main`` in a fresh interpreter (what an autoscaled worker
+pays before it can accept traffic), reports which heavy provider modules were
+loaded as a side effect, then times the lifespan warm-up phase separately.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("elevenlabs", "pypdf", "google.genai")
+
+_IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import main
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({"import_ms": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+_WARMUP_PROBE = """
+import json
+import main
+from app.warmup import WarmupState, warm_up
+state = warm_up(WarmupState())
+print(json.dumps(state.to_dict()))
+"""
+
+
+def _run_probe(code: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    samples = [_run_probe(_IMPORT_PROBE) for _ in range(args.runs)]
+    import_ms = [sample["import_ms"] for sample in samples]
+    print(f"import main: median {statistics.median(import_ms):.1f} ms, "
+          f"min {min(import_ms):.1f} ms, max {max(import_ms):.1f} ms over {args.runs} runs")
+    print(f"heavy modules loaded at import: {samples[-1]['loaded'] or 'none'}")
+
+    warmup = _run_probe(_WARMUP_PROBE)
+    print(f"warm-up: {warmup['duration_ms']} ms")
+    for name, status in warmup["steps"].items():
+        print(f"  {name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,46 @@
+from contextlib import asynccontextmanager
+
+import anyio
+from dotenv import load_dotenv
 from fastapi import FastAPI
-from app.api import simplify_text, analyze_doc, pdf_ingest, tts, translate, next_steps, draft_response, important_info, chat
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI(title="TidalHACK Backend API", version="1.0")
+load_dotenv()
+
+from app.api import simplify_text, analyze_doc, pdf_ingest, tts, translate, next_steps, draft_response, important_info, chat, health
+from app.responses import CompressionMiddleware, FastJSONResponse
+from app.warmup import WarmupState, run_warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so /health answers immediately; /ready flips once
+    # every required step has succeeded, retrying failed ones until then.
+    app.state.warmup = WarmupState()
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(run_warm_up, app.state.warmup)
+        yield
+        task_group.cancel_scope.cancel()
+
+
+app = FastAPI(
+    title="TidalHACK Backend API",
+    version="1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"]
+    allow_headers=["*"],
+    expose_headers=["X-Document-Id"],
 )
+app.add_middleware(CompressionMiddleware)
 
+app.include_router(health.router)
 app.include_router(simplify_text.router)
 app.include_router(analyze_doc.router)
 app.include_router(tts.router)
@@ -20,5 +49,4 @@ app.include_router(next_steps.router)
 app.include_router(draft_response.router)
 app.include_router(important_info.router)
 app.include_router(chat.router)
-#app.include_router(pdf_ingest.router)
-
+app.include_router(pdf_ingest.router)